@@ -1,11 +1,20 @@
 import html
 import json
+import mmap
+import operator
 import os
 import re
+import string
 import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Callable
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple, Callable, Mapping, Set
+from weakref import WeakValueDictionary
 
 from PyQt6 import QtCore, QtGui, QtWidgets, QtNetwork
 from PyQt6.QtCore import Qt, QUrl
@@ -19,11 +28,27 @@ except ImportError as exc:  # pragma: no cover - informs user about missing deps
         "缺少依赖 qbittorrent-api/PyQt6，运行前请执行 `pip install qbittorrent-api PyQt6 PyQt6-WebEngine`"
     ) from exc
 
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - 旧版本 Python
+    import sre_parse as _sre_parse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 为可选加速依赖
+    orjson = None
+
 
 CONFIG_PATH = Path("config.json")
 PROFILE_PATH = Path("web_profile")
-
-DEFAULT_CONFIG = {
+COMMENT_FETCH_WORKERS = 8
+PATH_EXISTS_TTL_SEC = 2.0
+PATH_EXISTS_CACHE_SIZE = 512
+RESOLVE_CACHE_SIZE = 1024
+WEB_LOAD_DEBOUNCE_MS = 150
+WEB_RESIZE_DEBOUNCE_MS = 60
+
+_DEFAULT_CONFIG: Dict[str, Any] = {
     "qbittorrent": {
         "host": "http://127.0.0.1",
         "port": 8080,
@@ -59,15 +84,87 @@ DEFAULT_CONFIG = {
 }
 
 
-def ensure_config_file(path: Path) -> Dict:
-    if not path.exists():
-        path.write_text(json.dumps(DEFAULT_CONFIG, ensure_ascii=False, indent=2), encoding="utf-8")
-    with path.open("r", encoding="utf-8") as fh:
-        return json.load(fh)
+def _dumps_config(data: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads_config(raw: bytes) -> Dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _load_config_file(path: Path) -> Dict:
+    if orjson is not None:
+        # orjson 可直接解析 mmap 的内存视图，省去一次读入缓冲
+        # 只有 mmap 本身失败才退回普通读取；JSON 解码错误直接抛出，不再重复解析
+        with path.open("rb") as fh:
+            try:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mm = None  # 空文件无法 mmap 等情况
+            if mm is not None:
+                with mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+    return _loads_config(path.read_bytes())
+
 
+def _freeze(value: Any) -> Any:
+    # 逐层复制为只读结构：dict -> MappingProxyType，list -> tuple
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
 
-def save_config_file(path: Path, data: Dict) -> None:
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+# 默认配置只读对外提供，首次运行写入的内容在导入时序列化一次
+_DEFAULT_CONFIG_BYTES = _dumps_config(_DEFAULT_CONFIG)
+DEFAULT_CONFIG: Mapping[str, Any] = _freeze(_DEFAULT_CONFIG)
+
+
+def ensure_config_file(path: Path) -> Dict:
+    if not path.exists():
+        path.write_bytes(_DEFAULT_CONFIG_BYTES)
+    return _load_config_file(path)
+
+
+# 已编译的正则按 (pattern, flags) 共享；没有 WebMode 引用时自动回收
+_PATTERN_CACHE: "WeakValueDictionary[Tuple[str, int], re.Pattern[str]]" = WeakValueDictionary()
+
+
+def _get_regex(pattern: str, flags: int = 0) -> "re.Pattern[str]":
+    key = (pattern, flags)
+    regex = _PATTERN_CACHE.get(key)
+    if regex is None:
+        regex = re.compile(pattern, flags)
+        _PATTERN_CACHE[key] = regex
+    return regex
+
+
+def _extract_prefilter(pattern: str) -> Optional[str]:
+    """返回匹配成功时必然出现的最长字面量子串，无法确定时返回 None。"""
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except re.error:
+        return None
+    if parsed.state.flags & re.IGNORECASE:
+        return None
+    # 只看顶层连续的字面量；分支、重复里的内容不一定出现
+    best = ""
+    run: List[str] = []
+    for op, arg in parsed:
+        if op is _sre_parse.LITERAL:
+            run.append(chr(arg))
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    if len(run) > len(best):
+        best = "".join(run)
+    return best or None
 
 
 @dataclass
@@ -80,27 +177,100 @@ class WebMode:
     categories: Optional[List[str]] = None
 
     def __post_init__(self) -> None:
-        self._regex = re.compile(self.pattern)
+        self._regex = _get_regex(self.pattern)
+        self._prefilter = _extract_prefilter(self.pattern)
+        self._cookie_pairs: Optional[List[Tuple[str, str]]] = None
         if self.categories is None:
             self.categories = []
+        self._template = self.template or "{value}"
+        self._render: Callable[["re.Match[str]"], Optional[str]]
+        # 命名分组 value 非空时覆盖整段匹配，此时不能走直接返回 group(0) 的快捷路径
+        if self._template == "{value}" and "value" not in self._regex.groupindex:
+            self._render = _match_value
+            return
+        try:
+            parsed = list(string.Formatter().parse(self._template))
+        except ValueError:
+            parsed = []
+        # 只保留字段名根部（如 tid.upper -> tid），渲染时按需取值
+        self._fields = tuple(
+            dict.fromkeys(field.partition(".")[0].partition("[")[0] for _, field, _, _ in parsed if field)
+        )
+        self._render = self._format_match
 
     def resolve(self, text: str) -> Optional[str]:
         if not text:
             return None
+        if self._prefilter and self._prefilter not in text:
+            return None
+        # 首尾无空白时 strip() 直接返回原对象，不会额外分配；
+        # 不能省略：group(0) 可能带上首尾空白，用 pos/endpos 截取也与 ^、后行断言语义不同
         match = self._regex.search(text.strip())
         if not match:
             return None
-        context = {"value": match.group(0)}
-        context.update({k: v for k, v in match.groupdict().items() if v})
-        template = self.template or "{value}"
+        return self._render(match)
+
+    def cookie_pairs(self) -> List[Tuple[str, str]]:
+        if self._cookie_pairs is None:
+            pairs: List[Tuple[str, str]] = []
+            for part in (self.cookie or "").split(";"):
+                name, sep, value = part.strip().partition("=")
+                if sep:
+                    pairs.append((name.strip(), value.strip()))
+            self._cookie_pairs = pairs
+        return self._cookie_pairs
+
+    def _format_match(self, match: "re.Match[str]") -> Optional[str]:
+        groups = match.groupdict()
+        context: Dict[str, str] = {}
+        for field in self._fields:
+            if field == "value":
+                context[field] = groups.get("value") or match.group(0)
+                continue
+            value = groups.get(field)
+            if not value:
+                return None
+            context[field] = value
         try:
-            return template.format(**context)
+            return self._template.format_map(context)
         except KeyError:
             return None
 
 
+def _match_value(match: "re.Match[str]") -> Optional[str]:
+    return match.group(0)
+
+
+def build_web_modes(config: Dict) -> List[WebMode]:
+    # 正则经 _get_regex 共享编译结果；手工改坏的模式直接跳过，避免启动失败
+    modes: List[WebMode] = []
+    for mode in config.get("web_modes", []):
+        try:
+            modes.append(WebMode(**mode))
+        except re.error:
+            continue
+    return modes
+
+
 @dataclass
 class TorrentRecord:
+    # 种子数量较多时省去每个实例的 __dict__；字段均无默认值，可直接声明 __slots__
+    __slots__ = (
+        "hash",
+        "name",
+        "category",
+        "state",
+        "progress",
+        "ratio",
+        "save_path",
+        "content_path",
+        "comment",
+        "num_seeds",
+        "num_leechs",
+        "added_on",
+        "name_lower",
+    )
+
     hash: str
     name: str
     category: str
@@ -114,6 +284,18 @@ class TorrentRecord:
     num_leechs: int
     added_on: int
 
+    def __post_init__(self) -> None:
+        # 排序键只算一次，不作为 dataclass 字段参与比较和 repr
+        self.name_lower = self.name.lower()
+
+
+def group_records(records: List[TorrentRecord]) -> List[Tuple[str, List[TorrentRecord]]]:
+    categories: Dict[str, List[TorrentRecord]] = defaultdict(list)
+    for record in records:
+        categories[record.category or "未分类"].append(record)
+    by_name = operator.attrgetter("name_lower")
+    return [(category, sorted(torrents, key=by_name)) for category, torrents in sorted(categories.items())]
+
 
 class QbClient:
     def __init__(self, cfg: Dict):
@@ -125,103 +307,329 @@ class QbClient:
             password=cfg.get("password"),
             VERIFY_WEBUI_CERTIFICATE=cfg.get("verify_ssl", False),
         )
-
-    def fetch_torrents(self, categories: Optional[List[str]] = None) -> List[TorrentRecord]:
+        self._logged_in = False
+        # sync/maindata 增量同步状态：合并后的原始字段与对应的记录缓存
+        self._last_rid = 0
+        self._maindata_supported = True
+        self._maindata_torrents: Dict[str, Dict[str, Any]] = {}
+        self._torrent_cache: Dict[str, TorrentRecord] = {}
+        # 还没取到注释的种子，每次轮询都会重试，直到补全成功
+        self._comment_pending: Set[str] = set()
+
+    def _ensure_login(self) -> None:
+        if self._logged_in:
+            return
         try:
             self.client.auth_log_in()
         except qbittorrentapi.LoginFailed as exc:
             raise RuntimeError(f"无法登录qBittorrent：{exc}") from exc
         except qbittorrentapi.APIConnectionError as exc:
             raise RuntimeError(f"无法连接qBittorrent：{exc}") from exc
+        self._logged_in = True
 
-        torrents: List[TorrentRecord] = []
-        missing_comment_indices: List[int] = []
-        source = self._collect_torrents(categories)
-        for idx, torrent in enumerate(source):
-            comment = getattr(torrent, "comment", "") or ""
-            if not comment:
-                missing_comment_indices.append(idx)
-            torrents.append(
-                TorrentRecord(
-                    hash=torrent.hash,
-                    name=torrent.name,
-                    category=torrent.category or "未分类",
-                    state=torrent.state,
-                    progress=float(torrent.progress),
-                    ratio=float(torrent.ratio),
-                    save_path=torrent.save_path,
-                    content_path=getattr(torrent, "content_path", torrent.save_path),
-                    comment=comment,
-                    num_seeds=getattr(torrent, "num_seeds", 0),
-                    num_leechs=getattr(torrent, "num_leechs", 0),
-                    added_on=getattr(torrent, "added_on", 0),
-                )
-            )
-
-        for idx in missing_comment_indices:
-            torrent_hash = source[idx].hash
-            try:
-                props = self.client.torrents_properties(torrent_hash)
-            except qbittorrentapi.NotFound404Error:
-                continue
-            except qbittorrentapi.APIConnectionError:
-                break
-            comment = getattr(props, "comment", "")
-            if comment:
-                torrents[idx].comment = comment
-
+    def _call_logged_in(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        self._ensure_login()
+        try:
+            return func(*args, **kwargs)
+        except qbittorrentapi.Forbidden403Error:
+            # 会话过期，重新登录后再试一次
+            self._logged_in = False
+            self._ensure_login()
+            return func(*args, **kwargs)
+
+    def fetch_maindata(self) -> List[TorrentRecord]:
+        if not self._maindata_supported:
+            return self.fetch_torrents()
+        try:
+            data = self._call_logged_in(self.client.sync_maindata, rid=self._last_rid)
+        except qbittorrentapi.NotFound404Error:
+            # 不支持 sync 接口时退回整表拉取；这是对服务端版本的判断而非临时重试，
+            # 本客户端对象之后一直走整表拉取，更换连接配置会新建客户端重新探测
+            self._maindata_supported = False
+            return self.fetch_torrents()
+
+        if data.get("full_update"):
+            self._maindata_torrents.clear()
+            self._torrent_cache.clear()
+            self._comment_pending.clear()
+        for torrent_hash in data.get("torrents_removed") or []:
+            self._maindata_torrents.pop(torrent_hash, None)
+            self._torrent_cache.pop(torrent_hash, None)
+            self._comment_pending.discard(torrent_hash)
+
+        # 只有新增或字段变化的种子才重新生成记录
+        for torrent_hash, delta in (data.get("torrents") or {}).items():
+            entry = self._maindata_torrents.setdefault(torrent_hash, {"hash": torrent_hash})
+            entry.update(delta)
+            if "comment" not in entry:
+                self._comment_pending.add(torrent_hash)
+            self._torrent_cache[torrent_hash] = self._to_record(entry)
+
+        if self._comment_pending:
+            # 上次补全失败的种子不一定会再出现在增量里，所以按待补集合整体重试
+            pending = [self._torrent_cache[torrent_hash] for torrent_hash in self._comment_pending]
+            for idx in self._backfill_comments(pending, list(range(len(pending)))):
+                record = pending[idx]
+                self._maindata_torrents[record.hash]["comment"] = record.comment
+                self._comment_pending.discard(record.hash)
+        self._last_rid = data.get("rid", 0)
+        return list(self._torrent_cache.values())
+
+    def fetch_torrents(self) -> List[TorrentRecord]:
+        source = self._call_logged_in(self._collect_torrents)
+        torrents = [self._to_record(torrent) for torrent in source]
+        # 新版 qBittorrent 的列表接口已带 comment 字段，只有缺失时才需要单独查询
+        missing_comment_indices = [idx for idx, torrent in enumerate(source) if "comment" not in torrent]
+        if missing_comment_indices:
+            self._backfill_comments(torrents, missing_comment_indices)
         return torrents
 
-    def _collect_torrents(self, categories: Optional[List[str]]) -> List[Any]:
-        torrents: List[Any] = []
-        seen: set[str] = set()
-        if not categories:
-            torrents = list(self.client.torrents_info())
-        else:
-            for category in categories:
-                try:
-                    subset = self.client.torrents_info(category=category)
-                except qbittorrentapi.NotFound404Error:
-                    continue
-                for torrent in subset:
-                    if torrent.hash in seen:
-                        continue
-                    torrents.append(torrent)
-                    seen.add(torrent.hash)
-        return torrents
+    @staticmethod
+    def _to_record(torrent: Mapping[str, Any]) -> TorrentRecord:
+        # TorrentDictionary 是 dict 子类，直接 get 比 getattr 省去属性查找
+        save_path = torrent["save_path"]
+        return TorrentRecord(
+            hash=torrent["hash"],
+            name=torrent["name"],
+            category=torrent["category"] or "未分类",
+            state=torrent["state"],
+            progress=float(torrent["progress"]),
+            ratio=float(torrent["ratio"]),
+            save_path=save_path,
+            content_path=torrent.get("content_path", save_path),
+            comment=torrent.get("comment") or "",
+            num_seeds=torrent.get("num_seeds", 0),
+            num_leechs=torrent.get("num_leechs", 0),
+            added_on=torrent.get("added_on", 0),
+        )
 
-    def list_categories(self) -> List[str]:
+    def _backfill_comments(self, torrents: List[TorrentRecord], indices: List[int]) -> List[int]:
+        done: List[int] = []
+        with ThreadPoolExecutor(max_workers=min(COMMENT_FETCH_WORKERS, len(indices))) as pool:
+            futures = [pool.submit(self._fetch_comment, torrents[idx].hash) for idx in indices]
+            for idx, future in zip(indices, futures):
+                try:
+                    comment = future.result()
+                except qbittorrentapi.APIConnectionError:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                if comment:
+                    torrents[idx].comment = comment
+                done.append(idx)
+        return done
+
+    def _fetch_comment(self, torrent_hash: str) -> str:
         try:
-            self.client.auth_log_in()
-        except qbittorrentapi.LoginFailed as exc:
-            raise RuntimeError(f"无法登录qBittorrent：{exc}") from exc
-        except qbittorrentapi.APIConnectionError as exc:
-            raise RuntimeError(f"无法连接qBittorrent：{exc}") from exc
+            props = self.client.torrents_properties(torrent_hash)
+        except qbittorrentapi.NotFound404Error:
+            return ""
+        return props.get("comment") or ""
+
+    def _collect_torrents(self) -> List[Any]:
+        # 分类筛选在界面本地完成，这里始终拉取全部种子
+        return list(self.client.torrents_info())
 
+    def list_categories(self) -> List[str]:
         try:
-            categories = self.client.torrents_categories()
+            categories = self._call_logged_in(self.client.torrents_categories)
         except qbittorrentapi.APIConnectionError as exc:
             raise RuntimeError(f"获取分类失败：{exc}") from exc
         names = sorted(categories.keys(), key=str.lower) if categories else []
         return names
 
 
-class FetchThread(QtCore.QThread):
-    data_ready = QtCore.pyqtSignal(list)
+class QbTaskSignals(QtCore.QObject):
+    succeeded = QtCore.pyqtSignal(object)
     failed = QtCore.pyqtSignal(str)
 
-    def __init__(self, client: QbClient, categories: Optional[List[str]] = None):
+
+class QbTask(QtCore.QRunnable):
+    """在线程池里执行一次 qBittorrent 请求，结果通过 signals 回到界面线程。"""
+
+    def __init__(self, func: Callable[[], Any]):
         super().__init__()
-        self.client = client
-        self.categories = categories
+        self.func = func
+        self.signals = QbTaskSignals()
 
     def run(self) -> None:
         try:
-            data = self.client.fetch_torrents(self.categories)
+            result = self.func()
         except Exception as exc:
-            self.failed.emit(str(exc))
+            self.signals.failed.emit(str(exc))
         else:
-            self.data_ready.emit(data)
+            self.signals.succeeded.emit(result)
+
+
+class _CategoryNode:
+    __slots__ = ("row", "name", "records", "populated")
+
+    def __init__(self, row: int, name: str, records: List[TorrentRecord]):
+        self.row = row
+        self.name = name
+        self.records = records
+        self.populated = False
+
+
+class TorrentTreeModel(QtCore.QAbstractItemModel):
+    """两级树模型：顶层为分类，子项为该分类下已排序的种子。
+
+    分类行的 internalPointer 为 None，种子行指向所属的 _CategoryNode。
+    子项在分类第一次展开时才通过 fetchMore 插入。
+    """
+
+    SELECTION_MARKER = "▶ "
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self._nodes: List[_CategoryNode] = []
+        # 只记住当前高亮行，不为每个种子维护额外的索引表
+        self._active_index = QtCore.QPersistentModelIndex()
+        self._active_hash: Optional[str] = None
+        self._bold_font = QtGui.QFont()
+        self._bold_font.setBold(True)
+
+    def set_groups(self, groups: List[Tuple[str, List[TorrentRecord]]]) -> None:
+        self.beginResetModel()
+        self._nodes = [_CategoryNode(row, name, records) for row, (name, records) in enumerate(groups)]
+        self._active_index = QtCore.QPersistentModelIndex()
+        self._active_hash = None
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.set_groups([])
+
+    def record_at(self, index: QtCore.QModelIndex) -> Optional[TorrentRecord]:
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if node is None:
+            return None
+        return node.records[index.row()]
+
+    def index_of(self, torrent_hash: str) -> QtCore.QModelIndex:
+        """按 hash 查找已展开分类下的种子行；分类尚未加载子项时返回无效索引。"""
+        for node in self._nodes:
+            if not node.populated:
+                continue
+            for row, record in enumerate(node.records):
+                if record.hash == torrent_hash:
+                    return self.createIndex(row, 0, node)
+        return QtCore.QModelIndex()
+
+    def set_active(self, index: QtCore.QModelIndex) -> None:
+        record = self.record_at(index)
+        if record is None:
+            index = QtCore.QModelIndex()
+        torrent_hash = record.hash if record is not None else None
+        if torrent_hash == self._active_hash:
+            return
+        previous = QtCore.QModelIndex(self._active_index)
+        self._active_index = QtCore.QPersistentModelIndex(index)
+        self._active_hash = torrent_hash
+        for changed in (previous, index):
+            if changed.isValid():
+                self.dataChanged.emit(changed, changed)
+
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, None)
+        return self.createIndex(row, column, self._nodes[parent.row()])
+
+    def parent(self, child: Optional[QtCore.QModelIndex] = None) -> Any:  # type: ignore[override]
+        if child is None:
+            return super().parent()
+        if not child.isValid():
+            return QtCore.QModelIndex()
+        node = child.internalPointer()
+        if node is None:
+            return QtCore.QModelIndex()
+        return self.createIndex(node.row, 0, None)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        if not parent.isValid():
+            return len(self._nodes)
+        if parent.internalPointer() is None:
+            node = self._nodes[parent.row()]
+            return len(node.records) if node.populated else 0
+        return 0
+
+    def hasChildren(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        if not parent.isValid():
+            return bool(self._nodes)
+        if parent.internalPointer() is None:
+            return bool(self._nodes[parent.row()].records)
+        return False
+
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        if not parent.isValid() or parent.internalPointer() is not None:
+            return False
+        node = self._nodes[parent.row()]
+        return not node.populated and bool(node.records)
+
+    def fetchMore(self, parent: QtCore.QModelIndex) -> None:
+        if not self.canFetchMore(parent):
+            return
+        node = self._nodes[parent.row()]
+        self.beginInsertRows(parent, 0, len(node.records) - 1)
+        node.populated = True
+        self.endInsertRows()
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # noqa: ARG002
+        return 1
+
+    def data(self, index: QtCore.QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if node is None:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self._nodes[index.row()].name
+            return None
+        record = node.records[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if record.hash == self._active_hash:
+                return f"{self.SELECTION_MARKER}{record.name}"
+            return record.name
+        if role == Qt.ItemDataRole.UserRole:
+            return record.hash
+        if role == Qt.ItemDataRole.FontRole and record.hash == self._active_hash:
+            return self._bold_font
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole and section == 0:
+            return "名称"
+        return None
+
+
+class ConfigWriterSignals(QtCore.QObject):
+    failed = QtCore.pyqtSignal(str)
+
+
+class ConfigWriter(QtCore.QRunnable):
+    def __init__(self, path: Path, raw: bytes, signals: ConfigWriterSignals):
+        super().__init__()
+        self.path = path
+        self.raw = raw
+        self.signals = signals
+
+    def run(self) -> None:
+        # 先写临时文件再替换，写到一半出错也不会截断原配置
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(self.raw)
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            self.signals.failed.emit(str(exc))
 
 
 class AutoScaleWebView(QWebEngineView):
@@ -236,24 +644,46 @@ class ElideLabel(QtWidgets.QLabel):
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None):
         super().__init__(parent)
         self._full_text = "-"
+        self._elide_cache: Dict[Tuple[str, int], str] = {}
+        self._last_width = -1
         self.setText("-")
         self.setToolTip("-")
         self.setSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Preferred)
 
     def set_full_text(self, text: str) -> None:
-        self._full_text = text or "-"
+        text = text or "-"
+        if text != self._full_text:
+            self._full_text = text
+            self._elide_cache.clear()
+            self.setToolTip(text)
+        self._last_width = -1
         self._update_elide()
 
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:  # type: ignore[override]
         super().resizeEvent(event)
         self._update_elide()
 
+    def changeEvent(self, event: QtCore.QEvent) -> None:  # type: ignore[override]
+        super().changeEvent(event)
+        # 缓存只按文本和宽度区分，字体或样式变化后省略结果全部作废
+        if event.type() in (QtCore.QEvent.Type.FontChange, QtCore.QEvent.Type.StyleChange):
+            self._elide_cache.clear()
+            self._last_width = -1
+            self._update_elide()
+
     def _update_elide(self) -> None:
-        metrics = self.fontMetrics()
-        available = max(10, self.width() - 6)
-        elided = metrics.elidedText(self._full_text, Qt.TextElideMode.ElideMiddle, available)
+        width = self.width()
+        # 拖动窗口时收窄不足 4px 仍在预留的 6px 边距内，无需重新省略；变宽则可能需要显示全文，总是重算
+        if 0 <= self._last_width - width < 4:
+            return
+        self._last_width = width
+        key = (self._full_text, width)
+        elided = self._elide_cache.get(key)
+        if elided is None:
+            available = max(10, width - 6)
+            elided = self.fontMetrics().elidedText(self._full_text, Qt.TextElideMode.ElideMiddle, available)
+            self._elide_cache[key] = elided
         super().setText(elided)
-        self.setToolTip(self._full_text)
 
 
 class CopyableLabel(ElideLabel):
@@ -299,6 +729,28 @@ class CopyablePlainText(QtWidgets.QPlainTextEdit):
         return self.toPlainText()
 
 
+_path_exists_cache: Dict[str, Tuple[float, bool]] = {}
+
+
+def _path_exists(path: Optional[str]) -> bool:
+    # 网络盘上 stat 代价较高，键盘连续切换时短时间内复用结果
+    if not path:
+        return False
+    now = time.monotonic()
+    cached = _path_exists_cache.get(path)
+    if cached is not None and now - cached[0] < PATH_EXISTS_TTL_SEC:
+        return cached[1]
+    try:
+        os.stat(path)
+        exists = True
+    except (OSError, ValueError):
+        exists = False
+    if len(_path_exists_cache) >= PATH_EXISTS_CACHE_SIZE:
+        _path_exists_cache.clear()
+    _path_exists_cache[path] = (now, exists)
+    return exists
+
+
 class InfoPanel(QtWidgets.QWidget):
     def __init__(self):
         super().__init__()
@@ -454,8 +906,9 @@ class InfoPanel(QtWidgets.QWidget):
         self.labels["content_path"].set_full_text(record.content_path)
         self.comment_box.setPlainText(record.comment or "-")
         self.comment_box.setVisible(self.toggle_comment_button.isChecked())
-        self._current_path = record.content_path if os.path.exists(record.content_path) else record.save_path
-        self.open_button.setEnabled(bool(self._current_path and os.path.exists(self._current_path)))
+        content_exists = _path_exists(record.content_path)
+        self._current_path = record.content_path if content_exists else record.save_path
+        self.open_button.setEnabled(content_exists or _path_exists(self._current_path))
 
     def _copy_label_text(self, label: ElideLabel) -> None:
         if hasattr(label, "full_text"):
@@ -485,14 +938,16 @@ class InfoPanel(QtWidgets.QWidget):
 
 
 class SettingsDialog(QtWidgets.QDialog):
-    def __init__(self, config: Dict, parent: Optional[QtWidgets.QWidget] = None):
+    def __init__(self, config: bytes, parent: Optional[QtWidgets.QWidget] = None):
         super().__init__(parent)
         self.setWindowTitle("设置")
         self.resize(820, 520)
-        self._config = json.loads(json.dumps(config))
+        # config 为已序列化的配置快照，解析一次即得到可随意修改的副本
+        self._config = _loads_config(config)
         self._config.setdefault("ui", dict(DEFAULT_CONFIG["ui"]))
         self._modes: List[Dict[str, Any]] = [dict(mode) for mode in self._config.get("web_modes", [])]
         self._last_mode_index: int = -1
+        self._form_dirty = False
 
         layout = QtWidgets.QVBoxLayout(self)
         self.tabs = QtWidgets.QTabWidget()
@@ -573,16 +1028,21 @@ class SettingsDialog(QtWidgets.QDialog):
         form_layout.addRow("Cookie", self.cookie_edit)
         layout.addLayout(form_layout, 2)
 
+        self.name_edit.textChanged.connect(self._mark_form_dirty)
+        self.pattern_edit.textChanged.connect(self._mark_form_dirty)
+        self.template_edit.textChanged.connect(self._mark_form_dirty)
+        self.desc_edit.textChanged.connect(self._mark_form_dirty)
+        self.cookie_edit.textChanged.connect(self._mark_form_dirty)
+
         self.tabs.addTab(tab, "网页模式")
         self._reload_mode_list()
         self._refresh_default_mode_combo()
 
     def _reload_mode_list(self) -> None:
-        self.mode_list.blockSignals(True)
-        self.mode_list.clear()
-        for mode in self._modes:
-            self.mode_list.addItem(mode.get("name") or "未命名")
-        self.mode_list.blockSignals(False)
+        with QtCore.QSignalBlocker(self.mode_list):
+            self.mode_list.clear()
+            for mode in self._modes:
+                self.mode_list.addItem(mode.get("name") or "未命名")
         if self.mode_list.count():
             self.mode_list.setCurrentRow(0)
             self._last_mode_index = 0
@@ -592,16 +1052,15 @@ class SettingsDialog(QtWidgets.QDialog):
 
     def _refresh_default_mode_combo(self) -> None:
         current = self._config.get("active_web_mode")
-        self.default_mode_combo.blockSignals(True)
-        self.default_mode_combo.clear()
-        self.default_mode_combo.addItem("自动匹配", None)
-        for mode in self._modes:
-            self.default_mode_combo.addItem(mode.get("name") or "未命名", mode.get("name"))
-        index = self.default_mode_combo.findData(current) if current else 0
-        if index < 0:
-            index = 0
-        self.default_mode_combo.setCurrentIndex(index)
-        self.default_mode_combo.blockSignals(False)
+        with QtCore.QSignalBlocker(self.default_mode_combo):
+            self.default_mode_combo.clear()
+            self.default_mode_combo.addItem("自动匹配", None)
+            for mode in self._modes:
+                self.default_mode_combo.addItem(mode.get("name") or "未命名", mode.get("name"))
+            index = self.default_mode_combo.findData(current) if current else 0
+            if index < 0:
+                index = 0
+            self.default_mode_combo.setCurrentIndex(index)
 
     def _on_mode_selected(self, row: int) -> None:
         if row == self._last_mode_index:
@@ -613,33 +1072,48 @@ class SettingsDialog(QtWidgets.QDialog):
             mode = self._modes[row]
         self._load_mode_into_form(mode)
 
+    def _mark_form_dirty(self, *_: Any) -> None:
+        self._form_dirty = True
+
     def _apply_current_mode_changes(self) -> None:
         idx = self._last_mode_index
         if idx < 0 or idx >= len(self._modes):
             return
         mode = self._modes[idx]
-        mode["name"] = self.name_edit.text().strip() or "未命名"
-        mode["pattern"] = self.pattern_edit.text().strip()
-        mode["template"] = self.template_edit.text().strip() or "{value}"
-        mode["description"] = self.desc_edit.toPlainText().strip()
-        mode["cookie"] = self.cookie_edit.toPlainText().strip()
+        # 表单未改动时不必回读控件，但规范化仍要做
+        if self._form_dirty:
+            mode["name"] = self.name_edit.text()
+            mode["pattern"] = self.pattern_edit.text()
+            mode["template"] = self.template_edit.text()
+            mode["description"] = self.desc_edit.toPlainText()
+            mode["cookie"] = self.cookie_edit.toPlainText()
+            self._form_dirty = False
+        self._normalize_mode(mode)
         self.mode_list.item(idx).setText(mode["name"])
 
+    @staticmethod
+    def _normalize_mode(mode: Dict[str, Any]) -> None:
+        mode["name"] = (mode.get("name") or "").strip() or "未命名"
+        mode["pattern"] = (mode.get("pattern") or "").strip()
+        mode["template"] = (mode.get("template") or "").strip() or "{value}"
+        mode["description"] = (mode.get("description") or "").strip()
+        mode["cookie"] = (mode.get("cookie") or "").strip()
+
     def _load_mode_into_form(self, mode: Optional[Dict[str, Any]]) -> None:
-        block = self.blockSignals(True)
-        if mode:
-            self.name_edit.setText(mode.get("name", ""))
-            self.pattern_edit.setText(mode.get("pattern", ""))
-            self.template_edit.setText(mode.get("template", ""))
-            self.desc_edit.setPlainText(mode.get("description", ""))
-            self.cookie_edit.setPlainText(mode.get("cookie", ""))
-        else:
-            self.name_edit.clear()
-            self.pattern_edit.clear()
-            self.template_edit.clear()
-            self.desc_edit.clear()
-            self.cookie_edit.clear()
-        self.blockSignals(block)
+        with QtCore.QSignalBlocker(self):
+            if mode:
+                self.name_edit.setText(mode.get("name", ""))
+                self.pattern_edit.setText(mode.get("pattern", ""))
+                self.template_edit.setText(mode.get("template", ""))
+                self.desc_edit.setPlainText(mode.get("description", ""))
+                self.cookie_edit.setPlainText(mode.get("cookie", ""))
+            else:
+                self.name_edit.clear()
+                self.pattern_edit.clear()
+                self.template_edit.clear()
+                self.desc_edit.clear()
+                self.cookie_edit.clear()
+        self._form_dirty = False
 
     def _add_mode(self) -> None:
         self._apply_current_mode_changes()
@@ -668,6 +1142,9 @@ class SettingsDialog(QtWidgets.QDialog):
 
     def accept(self) -> None:
         self._apply_current_mode_changes()
+        # 没打开过的模式也按同样规则规范化后再保存
+        for mode in self._modes:
+            self._normalize_mode(mode)
         if not self._validate_modes():
             return
         self._config["qbittorrent"] = {
@@ -724,7 +1201,7 @@ class SettingsDialog(QtWidgets.QDialog):
                 QtWidgets.QMessageBox.warning(self, "校验失败", f"模式 {mode.get('name')} 缺少正则表达式")
                 return False
             try:
-                re.compile(mode["pattern"])
+                _get_regex(mode["pattern"])
             except re.error as exc:
                 QtWidgets.QMessageBox.warning(
                     self,
@@ -738,6 +1215,39 @@ class SettingsDialog(QtWidgets.QDialog):
         return self._config
 
 
+# 自动缩放时注入的样式脚本，脚本本身可重复执行，但每个页面只需注入一次
+_SCROLL_STYLE_JS = """
+(function() {
+    const styleId = '__qblook_no_horizontal_scroll__';
+    let styleEl = document.getElementById(styleId);
+    if (!styleEl) {
+        styleEl = document.createElement('style');
+        styleEl.id = styleId;
+        styleEl.textContent = `
+            html, body {
+                overflow-x: hidden !important;
+                max-width: 100%;
+            }
+            * {
+                max-width: 100%;
+                box-sizing: border-box;
+            }
+        `;
+        document.head.appendChild(styleEl);
+    }
+})();
+"""
+
+# 未匹配页面只有注释一处会变，模板预先编码好，每次只替换占位符
+_UNMATCHED_TEMPLATE = """
+<div style='padding:24px;font-size:16px;'>
+    <h2>未匹配到可用的请求模式</h2>
+    <p>当前注释：{comment}</p>
+    <p>请检查配置文件里的 web_modes 正则规则。</p>
+</div>
+""".encode("utf-8")
+
+
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self, config: Dict):
         super().__init__()
@@ -746,28 +1256,56 @@ class MainWindow(QtWidgets.QMainWindow):
         self.resize(1400, 800)
 
         self.config = config
-        self.web_modes = [WebMode(**mode) for mode in config.get("web_modes", [])]
+        self._config_snapshot = _dumps_config(config)
+        # 配置写盘放到后台；单线程池保证多次保存按提交顺序落盘
+        self._config_pool = QtCore.QThreadPool(self)
+        self._config_pool.setMaxThreadCount(1)
+        self._config_write_signals = ConfigWriterSignals(self)
+        self._config_write_signals.failed.connect(self._on_config_write_failed)
+        self.web_modes = build_web_modes(config)
         self.active_mode_name: Optional[str] = self.config.get("active_web_mode")
+        # 同一条注释反复选中时直接复用解析结果；模式或默认模式变化时清空
+        self._resolve_cached = lru_cache(maxsize=RESOLVE_CACHE_SIZE)(self._resolve_comment_url_uncached)
+        self._effective_modes_cache: Optional[List[WebMode]] = None
+        self._cookie_applied: Set[Tuple[str, str]] = set()
         ui_cfg = self.config.get("ui", {})
         self.require_category_selection = bool(ui_cfg.get("require_category_selection", False))
         self.auto_scale_web = bool(ui_cfg.get("auto_scale_web", False))
-        self.web_profile = self._create_web_profile()
+        # QWebEngineProfile / 网页视图会拉起 Chromium，推迟到第一次需要显示网页时再创建
+        self._web_profile_instance: Optional[QWebEngineProfile] = None
+        self.web_view: Optional[AutoScaleWebView] = None
         self.qb_client = QbClient(config["qbittorrent"])
-        self.current_records: Dict[str, TorrentRecord] = {}
-        self.fetch_thread: Optional[FetchThread] = None
+        self.current_groups: List[Tuple[str, List[TorrentRecord]]] = []
+        # 同一时间只有一条 分类 -> 种子 的请求链在跑，QbClient 不会被并发使用
+        self._fetch_inflight = False
+        # 请求链进行中又要求刷新时先记下，当前链结束后再补跑一次
+        self._refresh_pending = False
+        # 更换连接配置时递增，旧请求链迟到的回调据此丢弃
+        self._fetch_generation = 0
+        self._qb_task_signals: Set[QbTaskSignals] = set()
         self.available_categories: List[str] = []
         self.selected_category: Optional[str] = None
         self._all_categories_value = "__ALL__"
-        self._selection_marker = "▶ "
-        self._current_tree_item: Optional[QtWidgets.QTreeWidgetItem] = None
+
+        # 连续切换种子时只加载最终停留的那一项
+        self._pending_record: Optional[TorrentRecord] = None
+        self._web_load_timer = QtCore.QTimer(self)
+        self._web_load_timer.setSingleShot(True)
+        self._web_load_timer.setInterval(WEB_LOAD_DEBOUNCE_MS)
+        self._web_load_timer.timeout.connect(self._do_pending_web_update)
+        self._scroll_style_injected_for_url: Optional[str] = None
+        # 拖动窗口时的一连串尺寸变化只在停下后缩放一次
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(WEB_RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._apply_web_scaling)
 
         self._setup_ui()
         self._create_actions()
         self.connection_label = QtWidgets.QLabel("qBittorrent：未连接")
         self.statusBar().addPermanentWidget(self.connection_label)
-        categories_loaded = self._load_categories()
         self.statusBar().showMessage("准备就绪")
-        if categories_loaded and not self.require_category_selection:
+        if not self.require_category_selection:
             self.selected_category = self._all_categories_value
         self.refresh_data()
 
@@ -775,82 +1313,36 @@ class MainWindow(QtWidgets.QMainWindow):
         splitter = QtWidgets.QSplitter(Qt.Orientation.Horizontal)
         self.setCentralWidget(splitter)
 
-        self.tree = QtWidgets.QTreeWidget()
-        self.tree.setHeaderLabels(["名称"])
+        self.tree = QtWidgets.QTreeView()
+        self.tree_model = TorrentTreeModel(self)
+        self.tree.setModel(self.tree_model)
+        self.tree.setUniformRowHeights(True)
         self.tree.header().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Stretch)
-        self.tree.itemSelectionChanged.connect(self._on_selection_changed)
-
-        self.web_view = AutoScaleWebView()
-        self.web_page = QWebEnginePage(self.web_profile, self.web_view)
-        self.web_view.setPage(self.web_page)
-        self.web_page.loadFinished.connect(lambda _: self._schedule_web_scaling())
-        self.web_view.resized.connect(self._apply_web_scaling_from_signal)
-        # self.web_view.setHtml("<h2 style='text-align:center;'>请选择一个种子以加载注释页面</h2>")
-        self.web_view.setHtml("""
-<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-<meta charset="UTF-8">
-<style>
-    body {
-        margin: 0;
-        height: 100vh;
-        display: flex;
-        justify-content: center;
-        align-items: center;
-        font-family: "Microsoft YaHei", sans-serif;
-        background: linear-gradient(135deg, #74ebd5, #ACB6E5); /* 渐变背景 */
-    }
-
-    .message-box {
-        background-color: rgba(255, 255, 255, 0.95); /* 半透明白色卡片 */
-        padding: 40px 60px;
-        border-radius: 16px;
-        box-shadow: 0 12px 24px rgba(0,0,0,0.2);
-        text-align: center;
-        animation: fadeIn 0.8s ease-in-out;
-    }
-
-    .message-box h2 {
-        margin: 0;
-        font-size: 24px;
-        color: #333;
-    }
-
-    .message-box p {
-        margin-top: 12px;
-        color: #666;
-        font-size: 16px;
-    }
-
-    .icon {
-        font-size: 48px;
-        color: #4a90e2;
-        margin-bottom: 20px;
-    }
+        self.tree.selectionModel().currentChanged.connect(self._on_selection_changed)
 
-    /* 简单淡入动画 */
-    @keyframes fadeIn {
-        from {opacity: 0; transform: translateY(-20px);}
-        to {opacity: 1; transform: translateY(0);}
-    }
-</style>
-</head>
-<body>
-    <div class="message-box">
-        <div class="icon">&#128269;</div> <!-- 放大镜图标 -->
-        <h2>请选择一个种子以加载注释页面</h2>
-        <p>选中左侧种子列表中的一项，即可查看详细信息</p>
-    </div>
-</body>
-</html>
-""")
-        self._schedule_web_scaling()
+        self.web_stack = QtWidgets.QStackedWidget()
+        self._web_placeholder = QtWidgets.QLabel(
+            "<div style='font-size:48px;'>&#128269;</div>"
+            "<h2>请选择一个种子以加载注释页面</h2>"
+            "<p style='color:#666;'>选中左侧种子列表中的一项，即可查看详细信息</p>"
+        )
+        self._web_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._web_placeholder.setStyleSheet(
+            """
+            QLabel {
+                font-family: "Microsoft YaHei", sans-serif;
+                font-size: 16px;
+                color: #333;
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #74ebd5, stop:1 #ACB6E5);
+            }
+            """
+        )
+        self.web_stack.addWidget(self._web_placeholder)
 
         self.info_panel = InfoPanel()
 
         splitter.addWidget(self.tree)
-        splitter.addWidget(self.web_view)
+        splitter.addWidget(self.web_stack)
         splitter.addWidget(self.info_panel)
         splitter.setStretchFactor(0, 5)
         splitter.setStretchFactor(1, 10)
@@ -886,163 +1378,174 @@ class MainWindow(QtWidgets.QMainWindow):
         toolbar.addWidget(self.category_selector)
         self._refresh_category_selector()
 
-    def _load_categories(self) -> bool:
-        try:
-            categories = self.qb_client.list_categories()
-        except RuntimeError as exc:
-            self.connection_label.setText("qBittorrent：连接失败")
-            self.statusBar().showMessage(str(exc))
-            return False
-        else:
-            self.connection_label.setText("qBittorrent：已连接")
-        if categories != self.available_categories:
-            self.available_categories = categories
-            self._refresh_category_selector()
-        return True
+    def _start_qb_task(
+        self, func: Callable[[], Any], on_success: Callable[[Any], None], on_failure: Callable[[str], None]
+    ) -> None:
+        task = QbTask(func)
+        signals = task.signals
+        generation = self._fetch_generation
+
+        def deliver(callback: Callable[[Any], None], result: Any) -> None:
+            self._qb_task_signals.discard(signals)
+            if generation == self._fetch_generation:
+                callback(result)
+
+        signals.succeeded.connect(lambda result: deliver(on_success, result))
+        signals.failed.connect(lambda message: deliver(on_failure, message))
+        # 任务对象跑完即被线程池释放，这里保留信号对象直到回调送达
+        self._qb_task_signals.add(signals)
+        QtCore.QThreadPool.globalInstance().start(task)
 
     def refresh_data(self) -> None:
-        if self.fetch_thread and self.fetch_thread.isRunning():
-            return
-        if not self._load_categories():
+        if self._fetch_inflight:
+            self._refresh_pending = True
             return
+        self._fetch_inflight = True
+        self._start_qb_task(self.qb_client.list_categories, self._on_categories_loaded, self._on_categories_failed)
+
+    def _on_categories_loaded(self, categories: List[str]) -> None:
+        self.connection_label.setText("qBittorrent：已连接")
+        if categories != self.available_categories:
+            self.available_categories = categories
+            self._refresh_category_selector()
         if self._should_block_fetch():
             self.statusBar().showMessage("请选择分类后再加载数据")
-            self.tree.clear()
+            self.tree_model.clear()
             self.info_panel.update_info(None)
+            self._finish_fetch()
             return
         self.statusBar().showMessage("正在从 qBittorrent 拉取数据...")
-        categories = self._get_selected_categories()
-        self.fetch_thread = FetchThread(self.qb_client, categories)
-        self.fetch_thread.data_ready.connect(self._on_data_ready)
-        self.fetch_thread.failed.connect(self._on_data_failed)
-        self.fetch_thread.start()
-
-    def _on_data_ready(self, records: List[TorrentRecord]) -> None:
-        self.fetch_thread = None
-        self.statusBar().showMessage(f"已加载 {len(records)} 个任务")
-        self.current_records = {record.hash: record for record in records}
-        categories: Dict[str, List[TorrentRecord]] = {}
-        for record in records:
-            categories.setdefault(record.category or "未分类", []).append(record)
-        self.tree.clear()
-        self._current_tree_item = None
-        for category, torrents in sorted(categories.items()):
-            cat_item = QtWidgets.QTreeWidgetItem([category])
-            cat_item.setFirstColumnSpanned(True)
-            for torrent in sorted(torrents, key=lambda t: t.name.lower()):
-                item = QtWidgets.QTreeWidgetItem([torrent.name])
-                item.setData(0, Qt.ItemDataRole.UserRole, torrent.hash)
-                item.setData(0, Qt.ItemDataRole.UserRole + 1, torrent.name)
-                cat_item.addChild(item)
-            self.tree.addTopLevelItem(cat_item)
-            cat_item.setExpanded(True)
-        self.tree.sortItems(0, Qt.SortOrder.AscendingOrder)
+        # 始终拉取全部种子，切换分类时只在本地筛选，不必再请求 qBittorrent；
+        # 分组和排序也在线程里完成，界面线程只负责填充模型
+        client = self.qb_client
+        self._start_qb_task(
+            lambda: group_records(client.fetch_maindata()), self._on_data_ready, self._on_data_failed
+        )
+
+    def _on_categories_failed(self, message: str) -> None:
+        self.connection_label.setText("qBittorrent：连接失败")
+        self.statusBar().showMessage(message)
+        self._finish_fetch()
+
+    def _on_data_ready(self, groups: List[Tuple[str, List[TorrentRecord]]]) -> None:
+        self.current_groups = groups
+        self._rebuild_tree()
+        self._finish_fetch()
+
+    def _finish_fetch(self) -> None:
+        self._fetch_inflight = False
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh_data()
+
+    def _rebuild_tree(self) -> None:
+        # 重建后原来的选中项已不存在，丢弃尚未触发的网页加载；同一种子仍在时下面再接上
+        pending = self._pending_record
+        self._web_load_timer.stop()
+        self._pending_record = None
+        model = self.tree_model
+        # 模型重置会收起所有分类并丢掉选中项，先记下展开状态、选中种子和滚动位置
+        expanded = {
+            model.data(model.index(row, 0))
+            for row in range(model.rowCount())
+            if self.tree.isExpanded(model.index(row, 0))
+        }
+        previous = model.record_at(self.tree.currentIndex())
+        scroll_value = self.tree.verticalScrollBar().value()
+
+        groups = [group for group in self.current_groups if self._category_matches(group[0])]
+        self.statusBar().showMessage(f"已加载 {sum(len(torrents) for _, torrents in groups)} 个任务")
+        model.set_groups(groups)
+        for row, (name, _) in enumerate(groups):
+            # 只有一个分类时直接展开；多个分类按需展开，避免一次铺开全部种子
+            if len(groups) == 1 or name in expanded:
+                category_index = model.index(row, 0)
+                # 视图要等下次布局才会 fetchMore，这里先填充子项，才能找回选中行
+                model.fetchMore(category_index)
+                self.tree.expand(category_index)
+
+        current = model.index_of(previous.hash) if previous is not None else QtCore.QModelIndex()
+        record = model.record_at(current)
+        if record is None:
+            self.info_panel.update_info(None)
+        else:
+            # 静默恢复选中项，避免每次刷新都重新加载当前网页
+            with QtCore.QSignalBlocker(self.tree.selectionModel()):
+                self.tree.setCurrentIndex(current)
+            model.set_active(current)
+            self.info_panel.update_info(record)
+            if pending is not None and pending.hash == record.hash:
+                self._pending_record = record
+                self._web_load_timer.start()
+        scroll_bar = self.tree.verticalScrollBar()
+        QtCore.QTimer.singleShot(0, lambda: scroll_bar.setValue(scroll_value))
 
     def _on_data_failed(self, message: str) -> None:
-        self.fetch_thread = None
         self.statusBar().showMessage("拉取失败")
         QtWidgets.QMessageBox.critical(self, "拉取失败", message)
+        self._finish_fetch()
 
-    def _on_selection_changed(self) -> None:
-        item = self.tree.currentItem()
-        if self._current_tree_item and self._current_tree_item is not item:
-            self._set_tree_item_marker(self._current_tree_item, False)
-        if not item or not item.parent():
+    def _on_selection_changed(self, *_: Any) -> None:
+        current = self.tree.currentIndex()
+        record = self.tree_model.record_at(current)
+        if record is None:
+            self._web_load_timer.stop()
+            self._pending_record = None
+            self.tree_model.set_active(QtCore.QModelIndex())
             self.info_panel.update_info(None)
-            self._current_tree_item = None
             return
-        self._set_tree_item_marker(item, True)
-        self._current_tree_item = item
-        torrent_hash = item.data(0, Qt.ItemDataRole.UserRole)
-        record = self.current_records.get(torrent_hash)
+        self.tree_model.set_active(current)
         self.info_panel.update_info(record)
         self._update_window_title(record)
-        self._update_web_view(record)
+        self._pending_record = record
+        self._web_load_timer.start()
 
-    def _update_web_view(self, record: Optional[TorrentRecord]) -> None:
-        if record is None:
-            self.web_view.setHtml("""
-<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-<meta charset="UTF-8">
-<style>
-    body {
-        margin: 0;
-        height: 100vh;
-        display: flex;
-        justify-content: center;
-        align-items: center;
-        font-family: "Microsoft YaHei", sans-serif;
-        background: linear-gradient(135deg, #74ebd5, #ACB6E5); /* 渐变背景 */
-    }
-
-    .message-box {
-        background-color: rgba(255, 255, 255, 0.95); /* 半透明白色卡片 */
-        padding: 40px 60px;
-        border-radius: 16px;
-        box-shadow: 0 12px 24px rgba(0,0,0,0.2);
-        text-align: center;
-        animation: fadeIn 0.8s ease-in-out;
-    }
-
-    .message-box h2 {
-        margin: 0;
-        font-size: 24px;
-        color: #333;
-    }
-
-    .message-box p {
-        margin-top: 12px;
-        color: #666;
-        font-size: 16px;
-    }
+    def _do_pending_web_update(self) -> None:
+        record, self._pending_record = self._pending_record, None
+        if record is not None:
+            self._update_web_view(record)
 
-    .icon {
-        font-size: 48px;
-        color: #4a90e2;
-        margin-bottom: 20px;
-    }
+    def _get_web_view(self) -> AutoScaleWebView:
+        if self.web_view is None:
+            self.web_view = AutoScaleWebView()
+            self.web_page = QWebEnginePage(self.web_profile, self.web_view)
+            self.web_view.setPage(self.web_page)
+            self.web_page.loadStarted.connect(self._reset_scroll_style_injection)
+            self.web_page.loadFinished.connect(self._on_web_load_finished)
+            self.web_view.resized.connect(self._on_web_view_resized)
+            self.web_stack.addWidget(self.web_view)
+        self.web_stack.setCurrentWidget(self.web_view)
+        return self.web_view
 
-    /* 简单淡入动画 */
-    @keyframes fadeIn {
-        from {opacity: 0; transform: translateY(-20px);}
-        to {opacity: 1; transform: translateY(0);}
-    }
-</style>
-</head>
-<body>
-    <div class="message-box">
-        <div class="icon">&#128269;</div> <!-- 放大镜图标 -->
-        <h2>请选择一个种子以加载注释页面</h2>
-        <p>选中左侧种子列表中的一项，即可查看详细信息</p>
-    </div>
-</body>
-</html>
-""")
+    def _update_web_view(self, record: Optional[TorrentRecord]) -> None:
+        if record is None:
+            # 切回占位标签即可，不必让网页视图重新解析一遍占位页面
+            self.web_stack.setCurrentWidget(self._web_placeholder)
             self._update_window_title(None)
-            self._schedule_web_scaling()
             return
+        web_view = self._get_web_view()
         url, mode = self._resolve_comment_url(record.comment)
         if url:
+            qurl = QUrl(url)
             if mode:
-                self._apply_mode_cookie(mode, url)
-            self.web_view.load(QUrl(url))
-            self._schedule_web_scaling()
+                self._apply_mode_cookie(mode, qurl)
+            web_view.load(qurl)
+            if self.auto_scale_web:
+                self._schedule_web_scaling()
             self.statusBar().showMessage(f"加载页面：{url}")
         else:
             escaped_comment = html.escape(record.comment) if record.comment else "无"
-            html_content = f"""
-                <div style='padding:24px;font-size:16px;'>
-                    <h2>未匹配到可用的请求模式</h2>
-                    <p>当前注释：{escaped_comment}</p>
-                    <p>请检查配置文件里的 web_modes 正则规则。</p>
-                </div>
-            """
-            self.web_view.setHtml(html_content)
-            self._schedule_web_scaling()
+            web_view.setContent(
+                _UNMATCHED_TEMPLATE.replace(b"{comment}", escaped_comment.encode("utf-8")),
+                "text/html; charset=utf-8",
+            )
+            if self.auto_scale_web:
+                self._schedule_web_scaling()
 
     def _resolve_comment_url(self, comment: str) -> Tuple[Optional[str], Optional[WebMode]]:
+        return self._resolve_cached(comment)
+
+    def _resolve_comment_url_uncached(self, comment: str) -> Tuple[Optional[str], Optional[WebMode]]:
         modes = self._get_effective_modes()
         for mode in modes:
             resolved = mode.resolve(comment)
@@ -1051,6 +1554,12 @@ class MainWindow(QtWidgets.QMainWindow):
         return None, None
 
     def _get_effective_modes(self) -> List[WebMode]:
+        # 排序结果只随配置和当前模式变化，两处变更时都会清空缓存
+        if self._effective_modes_cache is None:
+            self._effective_modes_cache = self._order_modes()
+        return self._effective_modes_cache
+
+    def _order_modes(self) -> List[WebMode]:
         if not self.web_modes:
             return []
         if self.active_mode_name:
@@ -1063,50 +1572,47 @@ class MainWindow(QtWidgets.QMainWindow):
     def _refresh_category_selector(self) -> None:
         if not hasattr(self, "category_selector"):
             return
-        block = self.category_selector.blockSignals(True)
-        current = self.selected_category
-        self.category_selector.clear()
-        if self.require_category_selection:
-            self.category_selector.addItem("未选择", None)
-        self.category_selector.addItem("全部", self._all_categories_value)
-        for name in self.available_categories:
-            self.category_selector.addItem(name, name)
-        if current is not None:
-            idx = self.category_selector.findData(current)
-            if idx >= 0:
-                self.category_selector.setCurrentIndex(idx)
+        with QtCore.QSignalBlocker(self.category_selector):
+            current = self.selected_category
+            self.category_selector.clear()
+            if self.require_category_selection:
+                self.category_selector.addItem("未选择", None)
+            self.category_selector.addItem("全部", self._all_categories_value)
+            for name in self.available_categories:
+                self.category_selector.addItem(name, name)
+            if current is not None:
+                idx = self.category_selector.findData(current)
+                if idx >= 0:
+                    self.category_selector.setCurrentIndex(idx)
+                else:
+                    self.category_selector.setCurrentIndex(0)
             else:
                 self.category_selector.setCurrentIndex(0)
-        else:
-            self.category_selector.setCurrentIndex(0)
-        self.category_selector.blockSignals(False)
         self.selected_category = self.category_selector.currentData()
 
     def _should_block_fetch(self) -> bool:
         return self.require_category_selection and (self.selected_category is None)
 
-    def _get_selected_categories(self) -> Optional[List[str]]:
+    def _category_matches(self, category: str) -> bool:
         if self.selected_category in (None, self._all_categories_value):
-            return None
-        return [self.selected_category]
+            return True
+        return category == self.selected_category
 
-    def _apply_mode_cookie(self, mode: WebMode, url: str) -> None:
-        cookie_string = (mode.cookie or "").strip()
-        if not cookie_string:
+    def _apply_mode_cookie(self, mode: WebMode, qurl: QUrl) -> None:
+        pairs = mode.cookie_pairs()
+        if not pairs:
             return
-        store = self.web_view.page().profile().cookieStore()
-        qurl = QUrl(url)
-        for part in cookie_string.split(";"):
-            part = part.strip()
-            if not part:
-                continue
-            if "=" not in part:
-                continue
-            name, value = part.split("=", 1)
-            cookie = QtNetwork.QNetworkCookie(name.strip().encode("utf-8"), value.strip().encode("utf-8"))
+        # 同一模式对同一站点本次会话只写入一次 Cookie
+        key = (mode.name, qurl.host())
+        if key in self._cookie_applied:
+            return
+        store = self.web_profile.cookieStore()
+        for name, value in pairs:
+            cookie = QtNetwork.QNetworkCookie(name.encode("utf-8"), value.encode("utf-8"))
             if not cookie.domain():
                 cookie.setDomain(qurl.host())
             store.setCookie(cookie, qurl)
+        self._cookie_applied.add(key)
 
     def _update_window_title(self, record: Optional[TorrentRecord]) -> None:
         if record:
@@ -1118,60 +1624,85 @@ class MainWindow(QtWidgets.QMainWindow):
         if not hasattr(self, "mode_selector"):
             return
         current = self.active_mode_name
-        block = self.mode_selector.blockSignals(True)
-        self.mode_selector.clear()
-        self.mode_selector.addItem("自动匹配", None)
-        for mode in self.web_modes:
-            self.mode_selector.addItem(mode.name, mode.name)
-        if current:
-            idx = self.mode_selector.findData(current)
-            if idx >= 0:
-                self.mode_selector.setCurrentIndex(idx)
+        with QtCore.QSignalBlocker(self.mode_selector):
+            self.mode_selector.clear()
+            self.mode_selector.addItem("自动匹配", None)
+            for mode in self.web_modes:
+                self.mode_selector.addItem(mode.name, mode.name)
+            if current:
+                idx = self.mode_selector.findData(current)
+                if idx >= 0:
+                    self.mode_selector.setCurrentIndex(idx)
+                else:
+                    self.mode_selector.setCurrentIndex(0)
             else:
                 self.mode_selector.setCurrentIndex(0)
-        else:
-            self.mode_selector.setCurrentIndex(0)
-        self.mode_selector.blockSignals(block)
 
     def _on_mode_selector_changed(self, index: int) -> None:  # noqa: ARG002
         if not hasattr(self, "mode_selector"):
             return
         self.active_mode_name = self.mode_selector.currentData()
+        self._resolve_cached.cache_clear()
+        self._effective_modes_cache = None
         self.config["active_web_mode"] = self.active_mode_name
-        save_config_file(CONFIG_PATH, self.config)
-        item = self.tree.currentItem()
-        if item and item.parent():
-            torrent_hash = item.data(0, Qt.ItemDataRole.UserRole)
-            record = self.current_records.get(torrent_hash)
+        self._save_config()
+        record = self.tree_model.record_at(self.tree.currentIndex())
+        if record is not None:
+            # 下面直接重新加载，避免防抖定时器随后再加载同一页面
+            self._web_load_timer.stop()
+            self._pending_record = None
             self._update_web_view(record)
 
     def _on_category_selector_changed(self, index: int) -> None:  # noqa: ARG002
         if not hasattr(self, "category_selector"):
             return
+        previous = self.selected_category
         self.selected_category = self.category_selector.currentData()
         if self.require_category_selection and self.selected_category is None:
-            self.tree.clear()
+            self.tree_model.clear()
             self.info_panel.update_info(None)
             self.statusBar().showMessage("请选择分类后再加载数据")
             return
-        self.refresh_data()
-        self._setup_shortcuts()
+        if self.current_groups and previous is not None:
+            self._rebuild_tree()
+        else:
+            self.refresh_data()
 
     def open_settings(self) -> None:
-        dialog = SettingsDialog(self.config, self)
+        dialog = SettingsDialog(self._config_snapshot, self)
         if dialog.exec() == QtWidgets.QDialog.DialogCode.Accepted:
             self.config = dialog.get_config()
-            save_config_file(CONFIG_PATH, self.config)
+            self._save_config()
             self._apply_config_changes()
 
+    def _save_config(self) -> None:
+        self._config_snapshot = _dumps_config(self.config)
+        self._config_pool.start(ConfigWriter(CONFIG_PATH, self._config_snapshot, self._config_write_signals))
+
+    def _on_config_write_failed(self, message: str) -> None:
+        self.statusBar().showMessage("保存配置失败")
+        QtWidgets.QMessageBox.critical(self, "保存配置失败", message)
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # type: ignore[override]
+        self._config_pool.waitForDone()
+        super().closeEvent(event)
+
     def _apply_config_changes(self) -> None:
-        self.web_modes = [WebMode(**mode) for mode in self.config.get("web_modes", [])]
+        self.web_modes = build_web_modes(self.config)
         self.active_mode_name = self.config.get("active_web_mode")
+        self._resolve_cached.cache_clear()
+        self._effective_modes_cache = None
+        self._cookie_applied.clear()
         self.qb_client = QbClient(self.config["qbittorrent"])
+        # 旧连接上未完成的请求链作废，下面的 refresh_data 立即用新连接开始
+        self._fetch_generation += 1
+        self._fetch_inflight = False
+        self._refresh_pending = False
         ui_cfg = self.config.get("ui", {})
         self.require_category_selection = bool(ui_cfg.get("require_category_selection", False))
         self.auto_scale_web = bool(ui_cfg.get("auto_scale_web", False))
         self.available_categories = []
+        self.current_groups = []
         self.selected_category = None if self.require_category_selection else self._all_categories_value
         self._refresh_mode_selector()
         self._refresh_category_selector()
@@ -1181,103 +1712,86 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:  # type: ignore[override]
         super().resizeEvent(event)
-        self._apply_web_scaling()
+        if self.auto_scale_web:
+            self._resize_timer.start()
+
+    def _on_web_view_resized(self, _width: int) -> None:
+        if self.auto_scale_web:
+            self._resize_timer.start()
+
+    def _reset_scroll_style_injection(self) -> None:
+        self._scroll_style_injected_for_url = None
 
-    def _apply_web_scaling_from_signal(self, width: int) -> None:
-        self._apply_web_scaling(width)
+    def _on_web_load_finished(self, _ok: bool) -> None:
+        # 加载过程中注入的样式可能落在旧文档上，加载完成后重新注入一次
+        self._reset_scroll_style_injection()
+        if self.auto_scale_web:
+            self._schedule_web_scaling()
 
     def _schedule_web_scaling(self) -> None:
         if not self.auto_scale_web:
             return
         QtCore.QTimer.singleShot(0, self._apply_web_scaling)
 
-    def _apply_web_scaling(self, width: Optional[int] = None) -> None:
-        if not hasattr(self, "web_view") or not self.auto_scale_web:
+    def _apply_web_scaling(self) -> None:
+        if self.web_view is None or not self.auto_scale_web:
             return
-        view_width = width if width is not None else self.web_view.width()
+        view_width = self.web_view.width()
         if view_width <= 0:
             return
         base_width = 1100
         scale_factor = min(1.0, view_width / base_width)
-        self.web_view.page().setZoomFactor(scale_factor)
+        page = self.web_view.page()
+        # 缩放变化很小时不再触发网页重新排版
+        if abs(page.zoomFactor() - scale_factor) >= 0.01:
+            page.setZoomFactor(scale_factor)
         self._apply_horizontal_scroll_style()
 
     def _apply_horizontal_scroll_style(self) -> None:
-        if not self.auto_scale_web or not hasattr(self, "web_view"):
+        if not self.auto_scale_web or self.web_view is None:
             return
-        script = """
-        (function() {
-            const styleId = '__qblook_no_horizontal_scroll__';
-            let styleEl = document.getElementById(styleId);
-            if (!styleEl) {
-                styleEl = document.createElement('style');
-                styleEl.id = styleId;
-                styleEl.textContent = `
-                    html, body {
-                        overflow-x: hidden !important;
-                        max-width: 100%;
-                    }
-                    * {
-                        max-width: 100%;
-                        box-sizing: border-box;
-                    }
-                `;
-                document.head.appendChild(styleEl);
-            }
-        })();
-        """
-        self.web_view.page().runJavaScript(script)
-
-    def _set_tree_item_marker(self, item: QtWidgets.QTreeWidgetItem, active: bool) -> None:
-        original = item.data(0, Qt.ItemDataRole.UserRole + 1) or item.text(0)
-        if active:
-            item.setText(0, f"{self._selection_marker}{original}")
-            font = item.font(0)
-            font.setBold(True)
-            item.setFont(0, font)
-        else:
-            item.setText(0, str(original))
-            font = item.font(0)
-            font.setBold(False)
-            item.setFont(0, font)
+        page = self.web_view.page()
+        url = page.url().toString()
+        if url == self._scroll_style_injected_for_url:
+            return
+        self._scroll_style_injected_for_url = url
+        page.runJavaScript(_SCROLL_STYLE_JS)
 
     def _setup_shortcuts(self) -> None:
-        for shortcut in getattr(self, "_shortcuts", []):
-            shortcut.setParent(None)
-        self._shortcuts = []
         ui_cfg = self.config.get("ui", {})
-        up_seq = QtGui.QKeySequence(ui_cfg.get("shortcut_up", "W"))
-        down_seq = QtGui.QKeySequence(ui_cfg.get("shortcut_down", "S"))
-        copy_seq = QtGui.QKeySequence(ui_cfg.get("shortcut_copy", "D"))
-        up_shortcut = QtGui.QShortcut(up_seq, self)
-        up_shortcut.activated.connect(self._tree_select_up)  # type: ignore[attr-defined]
-        down_shortcut = QtGui.QShortcut(down_seq, self)
-        down_shortcut.activated.connect(self._tree_select_down)  # type: ignore[attr-defined]
-        copy_shortcut = QtGui.QShortcut(copy_seq, self)
-        copy_shortcut.activated.connect(self._copy_current_content_path)  # type: ignore[attr-defined]
-        self._shortcuts.extend([up_shortcut, down_shortcut, copy_shortcut])
-
-    def _tree_select_up(self) -> None:
-        current = self.tree.currentItem()
-        if not current:
+        seqs = (
+            ui_cfg.get("shortcut_up", "W"),
+            ui_cfg.get("shortcut_down", "S"),
+            ui_cfg.get("shortcut_copy", "D"),
+        )
+        if seqs == getattr(self, "_applied_shortcut_seqs", None):
             return
-        parent = current.parent()
-        if not parent:
+        self._applied_shortcut_seqs = seqs
+        shortcuts: List[QtGui.QShortcut] = getattr(self, "_shortcuts", [])
+        if shortcuts:
+            # 快捷键对象保持不变，只更新按键序列
+            for shortcut, seq in zip(shortcuts, seqs):
+                shortcut.setKey(QtGui.QKeySequence(seq))
             return
-        index = parent.indexOfChild(current)
-        if index > 0:
-            self.tree.setCurrentItem(parent.child(index - 1))
+        for seq, slot in zip(seqs, (self._tree_select_up, self._tree_select_down, self._copy_current_content_path)):
+            shortcut = QtGui.QShortcut(QtGui.QKeySequence(seq), self)
+            shortcut.activated.connect(slot)  # type: ignore[attr-defined]
+            shortcuts.append(shortcut)
+        self._shortcuts = shortcuts
+
+    def _tree_select_up(self) -> None:
+        self._tree_select_sibling(-1)
 
     def _tree_select_down(self) -> None:
-        current = self.tree.currentItem()
-        if not current:
-            return
-        parent = current.parent()
-        if not parent:
+        self._tree_select_sibling(1)
+
+    def _tree_select_sibling(self, offset: int) -> None:
+        current = self.tree.currentIndex()
+        if self.tree_model.record_at(current) is None:
             return
-        index = parent.indexOfChild(current)
-        if index < parent.childCount() - 1:
-            self.tree.setCurrentItem(parent.child(index + 1))
+        target = current.siblingAtRow(current.row() + offset)
+        if target.isValid():
+            self.tree.setCurrentIndex(target)
 
     def _copy_current_content_path(self) -> None:
         if not self.info_panel or "content_path" not in self.info_panel.labels:
@@ -1319,6 +1833,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self._toast.show()
         QtCore.QTimer.singleShot(2000, self._toast.hide)
     
+    @property
+    def web_profile(self) -> QWebEngineProfile:
+        if self._web_profile_instance is None:
+            self._web_profile_instance = self._create_web_profile()
+        return self._web_profile_instance
+
     def _create_web_profile(self) -> QWebEngineProfile:
         PROFILE_PATH.mkdir(parents=True, exist_ok=True)
         storage_path = PROFILE_PATH / "storage"